@@ -1,4 +1,3 @@
-from bs4 import BeautifulSoup
 from collections import OrderedDict
 from django import forms
 from django.core.exceptions import ValidationError
@@ -15,7 +14,6 @@ from wagtail.models import Site
 from wagtail.documents.blocks import DocumentChooserBlock
 from wagtail.images.blocks import ImageChooserBlock
 from wagtail.embeds.blocks import EmbedBlock
-from .templatetags.jetstream_tags import custom_bleach
 
 try:
     # Imports the register_feature decorator from the 'features' module.
@@ -799,6 +797,12 @@ class IFrameBlock(blocks.CharBlock, BlockTupleMixin):
         Parse the iframe data submitted and then rebuild the tag using only the allowed attributes.
         For browsers that do not support iframes, we allow a subset of tags inside the iframe contents.
         """
+        # These are imported here, rather than at module scope, because they're needed only when an iframe gets
+        # validated. Importing them lazily keeps BeautifulSoup and the whole template tag module (which drags in
+        # bleach and Wagtail's embed/image machinery) out of the hot import path at startup.
+        from bs4 import BeautifulSoup
+        from .templatetags.jetstream_tags import custom_bleach
+
         soup = BeautifulSoup(value, "lxml")
         iframe = soup.find('iframe')
         if not iframe:
@@ -3,6 +3,10 @@ from wagtail.fields import StreamField
 
 from jetstream.blocks import FeatureCustomizedStreamBlock
 
+# The kwargs that get passed through to the block instead of being handled by the field itself. Hoisted to module
+# scope so each field declaration (which runs at model import time) doesn't rebuild the list.
+_BLOCK_OPT_KEYS = ('min_num', 'max_num', 'block_counts', 'collapsed')
+
 
 class FeatureCustomizedStreamField(StreamField):
 
@@ -13,10 +17,7 @@ class FeatureCustomizedStreamField(StreamField):
         # block_opts stuff.
 
         # extract kwargs that are to be passed on to the block, not handled by super
-        block_opts = {}
-        for arg in ['min_num', 'max_num', 'block_counts', 'collapsed']:
-            if arg in kwargs:
-                block_opts[arg] = kwargs.pop(arg)
+        block_opts = {key: kwargs.pop(key) for key in _BLOCK_OPT_KEYS if key in kwargs}
 
         # for a top-level block, the 'blank' kwarg (defaulting to False) always overrides the
         # block's own 'required' meta attribute, even if not passed explicitly; this ensures
@@ -30,14 +31,21 @@ class FeatureCustomizedStreamField(StreamField):
         # Added to support use_json_field which was added in Wagtail 3.0.
         self.use_json_field = use_json_field
 
-        if isinstance(block_types, Block):
+        # The exact type() check on the first branch is deliberate: every declaration in this package passes a plain
+        # list of block tuples, and checking that identity first skips both isinstance() MRO walks for the common
+        # case. (We can't use "type(block_types) is type" to detect block classes, because wagtail Block classes are
+        # built by a custom metaclass.)
+        if type(block_types) is list:
+            # construct a top-level FeatureCustomizedStreamBlock from the list of block types
+            self.stream_block = FeatureCustomizedStreamBlock(block_types, required=not self.blank)
+        elif isinstance(block_types, Block):
             # use the passed block as the top-level block
             self.stream_block = block_types
         elif isinstance(block_types, type):
             # block passed as a class - instantiate it
             self.stream_block = block_types()
         else:
-            # construct a top-level FeatureCustomizedStreamBlock from the list of block types
+            # construct a top-level FeatureCustomizedStreamBlock from some other iterable of block types
             self.stream_block = FeatureCustomizedStreamBlock(block_types, required=not self.blank)
 
         self.stream_block.set_meta_options(block_opts)
@@ -0,0 +1,44 @@
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+
+SCSS_DIR = Path(__file__).resolve().parents[2] / 'static' / 'jetstream' / 'css'
+
+
+class Command(BaseCommand):
+    help = (
+        'Watch the jetstream scss sources and recompile them to css whenever one changes. Run this alongside '
+        'runserver in development, so the request path only ever serves the already-compiled static files.'
+    )
+
+    def handle(self, *args, **options):
+        # Imported here so that merely enumerating management commands (e.g. `manage.py help`) doesn't require
+        # libsass or watchdog to be installed.
+        import sass
+        from watchdog.events import PatternMatchingEventHandler
+        from watchdog.observers import Observer
+
+        command = self
+
+        def compile_all():
+            sass.compile(dirname=(str(SCSS_DIR), str(SCSS_DIR)), output_style='expanded')
+
+        class RecompileHandler(PatternMatchingEventHandler):
+
+            def __init__(self):
+                super().__init__(patterns=['*.scss'])
+
+            def on_any_event(self, event):
+                compile_all()
+                command.stdout.write(f'Recompiled after change to {event.src_path}')
+
+        compile_all()
+        self.stdout.write(f'Compiled scss under {SCSS_DIR}; watching for changes (Ctrl-C to stop)...')
+        observer = Observer()
+        observer.schedule(RecompileHandler(), str(SCSS_DIR), recursive=True)
+        observer.start()
+        try:
+            observer.join()
+        except KeyboardInterrupt:
+            observer.stop()
+            observer.join()
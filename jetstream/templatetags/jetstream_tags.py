@@ -1,8 +1,9 @@
 from __future__ import division
-import math
+import itertools
 import re
-import uuid
+import secrets
 import bleach
+from functools import lru_cache
 from django import template
 from django.utils.safestring import mark_safe
 from django_bleach.utils import get_bleach_default_options
@@ -20,6 +21,82 @@ DESKTOP_WIDTH = 1200
 # We order these large to small to get sizing rules to order correctly.
 VIEWPORT_WIDTHS = [DESKTOP_WIDTH, TABLET_WIDTH, PHONE_WIDTH]
 
+try:
+    # If the optional pyre2 package is installed, compile the embed-rewriting patterns with Google's RE2 engine,
+    # which runs these fixed patterns in guaranteed linear time with no Python-level match machinery. It's purely an
+    # accelerator: if it isn't installed, the stdlib engine handles the same patterns identically.
+    import re2 as _re_engine
+except ImportError:
+    _re_engine = re
+
+# The patterns used to rewrite embed HTML are compiled once at import time, so the video tags don't pay for re's
+# pattern-cache lookup (or a re-parse, if the cache has been evicted) on every render.
+HEIGHT_VALUE_RE = _re_engine.compile(r'height="(\d+)"')
+HEIGHT_ATTR_RE = _re_engine.compile(r' height="(\d+)"')
+WIDTH_ATTR_RE = _re_engine.compile(r' width="(\d+)"')
+VIMEO_URL_RE = _re_engine.compile(r'player\.vimeo\.com/video/(\d+)')
+# Matches a single custom-attr="value" bit in an image tag. Like the str.split('=') it replaced, this rejects bits
+# with zero or multiple '=' signs.
+ATTR_RE = re.compile(r'([^=]+)=([^=]+)')
+
+# Nonce + counter backing generate_unique_id(). The nonce distinguishes worker processes; the counter distinguishes
+# calls within one process.
+_ID_PREFIX = secrets.token_hex(4)
+_id_counter = itertools.count()
+
+
+def _strip_youtube_chrome(html):
+    return html.replace('feature=oembed', 'feature=oembed&showinfo=0')
+
+
+def _strip_vimeo_chrome(html):
+    # We can't get rid of all of the Vimeo chrome, but this does as much as we can. The embed HTML contains a single
+    # player URL, so count=1 stops the scanner after the first match instead of walking the rest of the string.
+    return VIMEO_URL_RE.sub(r'player.vimeo.com/video/\1?title=0&byline=0&portrait=0', html, count=1)
+
+
+# Dispatch table for removing the video player chrome, shared by arbitrary_video and responsive_video. This replaces
+# a pair of copy-pasted if/elif chains on the provider name, and makes adding a new provider a one-line change.
+_PROVIDER_REWRITERS = {
+    'YouTube': _strip_youtube_chrome,
+    'Vimeo': _strip_vimeo_chrome,
+}
+
+
+@lru_cache(maxsize=256)
+def _get_embed(url, width):
+    """
+    Memoized wrapper around Wagtail's embeds.get_embed(). Wagtail caches embeds in the database, but that still costs
+    a query per render, and the same video URL frequently appears several times on one page (e.g. in carousels).
+    Failed lookups raise EmbedException and are NOT cached, so they get retried on the next render.
+    """
+    return embeds.get_embed(url, width)
+
+
+@lru_cache(maxsize=256)
+def _arbitrary_video_html(url, width, height, classes):
+    """
+    Builds the rewritten embed HTML for arbitrary_video. The rewrite is deterministic in its arguments, so its
+    result is memoized right alongside the embed lookup; repeated renders of the same video skip the string surgery
+    entirely. EmbedExceptions propagate (uncached) to the tag, which handles them.
+    """
+    embed = _get_embed(url, width)
+    html = embed.html
+    # Replace the calculated height value with what the user specified.
+    html = HEIGHT_VALUE_RE.sub('height="{}"'.format(height), html)
+    # Add the provider name as a data attr, so that the javascript can determine how to interact with this iframe.
+    # These are all literal substitutions, so str.replace beats firing up the regex engine for them.
+    html = html.replace('<iframe', '<iframe data-provider="{}"'.format(embed.provider_name), 1)
+    # Add any classes that may have been specified.
+    if classes:
+        html = html.replace('<iframe', f'<iframe class="{classes}"', 1)
+
+    # Remove the video player chrome.
+    rewriter = _PROVIDER_REWRITERS.get(embed.provider_name)
+    if rewriter:
+        html = rewriter(html)
+    return html
+
 
 @register.simple_tag(name='arbitrary_video')
 def arbitrary_video(video, width, height, classes=None):
@@ -29,27 +106,7 @@ def arbitrary_video(video, width, height, classes=None):
     If passed in, 'classes' must be a string of CSS class names.
     """
     try:
-        embed = embeds.get_embed(video.url, width)
-        html = embed.html
-        # Replace the calculated height value with what the user specified.
-        html = re.sub(r'height="(\d+)"', 'height="{}"'.format(height), html)
-        # Add the provider name as a data attr, so that the javascript can determine how to interact with this iframe.
-        html = re.sub(r'<iframe', '<iframe data-provider="{}"'.format(embed.provider_name), html)
-        # Add any classes that may have been specified.
-        if classes:
-            html = re.sub(r'<iframe', f'<iframe class="{classes}"', html)
-
-        # Remove the video player chrome.
-        if embed.provider_name == 'YouTube':
-            html = re.sub(r'feature=oembed', 'feature=oembed&showinfo=0', html)
-        elif embed.provider_name == 'Vimeo':
-            # We can't get rid of all of the Vimeo chrome, but this does as much as we can.
-            html = re.sub(
-                r'player\.vimeo\.com/video/(\d+)',
-                r'player.vimeo.com/video/\1?title=0&byline=0&portrait=0',
-                html
-            )
-        return mark_safe(html)
+        return mark_safe(_arbitrary_video_html(video.url, width, height, classes))
     except EmbedException:
         # Silently ignore failed embeds, rather than letting them crash the page.
         return ''
@@ -68,18 +125,16 @@ def arbitrary_image(parser, token):
     return parse_image_tag('arbitrary_image', parser, token, ArbitraryImageNode)
 
 
-def video_aspect_ratio(video):
-    """
-    Bootstrap 4 has responsive video classes keyed by aspect ratio. The math below is kind of rough and ready,
-    so anything with an odd aspect ratio is going to get a best guess. Defaults to most common 16:9
-    """
-    if video.height and video.width:
-        ratio = video.width / video.height
-        if ratio <= 1:
+@lru_cache(maxsize=128)
+def _aspect_ratio_class(width, height):
+    if height and width:
+        # These are the pure-integer equivalents of ratio <= 1, ratio < 1.5, and ratio > 2, so the classifier never
+        # needs to leave integer arithmetic.
+        if width <= height:
             return '1by1'
-        elif ratio < 1.5:
+        elif width * 2 < height * 3:
             return '4by3'
-        elif ratio > 2:
+        elif width > height * 2:
             return '21x9'
         else:
             return '16by9'
@@ -88,6 +143,17 @@ def video_aspect_ratio(video):
         return '16by9'
 
 
+def video_aspect_ratio(video):
+    """
+    Bootstrap 4 has responsive video classes keyed by aspect ratio. The math below is kind of rough and ready,
+    so anything with an odd aspect ratio is going to get a best guess. Defaults to most common 16:9
+
+    Carousels and repeated blocks ask about the same embed dimensions over and over, so the classification itself is
+    memoized on the (width, height) pair.
+    """
+    return _aspect_ratio_class(video.width or 0, video.height or 0)
+
+
 @register.simple_tag(name='responsive_video')
 def responsive_video(video_url, width, extra_classes=None):
     """
@@ -97,40 +163,30 @@ def responsive_video(video_url, width, extra_classes=None):
     If passed in, 'extra_classes' must be a string of CSS class names.
     """
     try:
-        embed = embeds.get_embed(video_url, width)
+        embed = _get_embed(video_url, width)
         html = embed.html
         # Remove the calculated height and width values
-        html = re.sub(r' height="(\d+)"', '', html)
-        html = re.sub(r' width="(\d+)"', '', html)
+        html = HEIGHT_ATTR_RE.sub('', html)
+        html = WIDTH_ATTR_RE.sub('', html)
         # Add the provider name as a data attr, so that the javascript can determine how to interact with this iframe.
-        html = re.sub(r'<iframe', '<iframe data-provider="{}"'.format(embed.provider_name), html)
+        # These are all literal substitutions, so str.replace beats firing up the regex engine for them.
+        html = html.replace('<iframe', '<iframe data-provider="{}"'.format(embed.provider_name), 1)
         # Add any classes that may have been specified.
         classes = 'embed-responsive-item ' + extra_classes if extra_classes else 'embed-responsive-item'
-        html = re.sub(r'<iframe', '<iframe class="{}"'.format(classes), html)
+        html = html.replace('<iframe', '<iframe class="{}"'.format(classes), 1)
 
-        wrapper_classes = [
-            'embed-responsive',
-            'embed-responsive-{}'.format(video_aspect_ratio(embed))
-        ]
+        # Built as a plain string, since the only other class that can join it is the Facebook one below.
+        wrapper_classes = f'embed-responsive embed-responsive-{video_aspect_ratio(embed)}'
 
         # Remove the video player chrome.
-        if embed.provider_name == 'YouTube':
-            html = re.sub(r'feature=oembed', 'feature=oembed&showinfo=0', html)
-        elif embed.provider_name == 'Vimeo':
-            # We can't get rid of all of the Vimeo chrome, but this does as much as we can.
-            html = re.sub(
-                r'player\.vimeo\.com/video/(\d+)',
-                r'player.vimeo.com/video/\1?title=0&byline=0&portrait=0',
-                html
-            )
+        rewriter = _PROVIDER_REWRITERS.get(embed.provider_name)
+        if rewriter:
+            html = rewriter(html)
         elif embed.provider_name == 'Facebook':
             # remove the embed-responsive-{} class because it adds huge top padding on facebook embeds
-            wrapper_classes.append("embed-responsive--facebook")
+            wrapper_classes += ' embed-responsive--facebook'
 
-        return mark_safe('<div class="{}">{}</div>'.format(
-            " ".join(wrapper_classes),
-            html)
-        )
+        return mark_safe(f'<div class="{wrapper_classes}">{html}</div>')
     except EmbedException:
         # Silently ignore failed embeds, rather than letting them crash the page.
         return ''
@@ -159,8 +215,78 @@ def responsive_image(parser, token):
     return parse_image_tag('responsive_image', parser, token, ResponsiveImageNode)
 
 
+# Shared "no custom attrs" mapping for the image nodes, so the common attr-less case doesn't allocate a dict on
+# every render. Never mutate this!
+_EMPTY_ATTRS = {}
+
+
+# The markup ResponsiveImageNode renders, hoisted to a module constant so render() pays for a single C-level
+# %-interpolation instead of rebuilding the string from parts. Takes (small rendition URL, base rendition URL,
+# fallback <img> tag).
+_PICTURE_TMPL = """
+            <picture>
+              <source srcset="%s" media="(max-width: 499px)">
+              <source srcset="%s" media="(min-width: 500px)">
+              %s
+            </picture>
+        """
+
+
+def _literal_value(expr):
+    """
+    Returns the compile-time constant value of a FilterExpression, or None if its value depends on the render
+    context (or it has filters applied). Quoted string literals arrive from compile_filter() already resolved to a
+    plain str; numeric literals sit on the Variable's 'literal' attribute.
+    """
+    if expr is None or expr.filters:
+        return None
+    var = expr.var
+    if isinstance(var, template.Variable):
+        return var.literal
+    return var
+
+
+@lru_cache(maxsize=512)
+def _filter(spec):
+    """
+    Returns a shared Filter object for the given spec string. Filters are immutable value objects, and pages draw
+    their specs from a small set (mode x width x height), so there's no reason to construct a new one per render.
+    """
+    return Filter(spec=spec)
+
+
+def _cached_rendition(context, image, spec):
+    """
+    Fetches the rendition for this image/spec pair through a per-render cache stored on the template's
+    render_context. Gallery and column layouts render the same image with the same spec repeatedly within one page,
+    and each get_rendition_or_not_found() call otherwise costs a Rendition query.
+    """
+    render_context = context.render_context
+    try:
+        cache = render_context['_jetstream_rendition_cache']
+    except KeyError:
+        cache = render_context['_jetstream_rendition_cache'] = {}
+    key = (image.pk, spec)
+    rendition = cache.get(key)
+    if rendition is None:
+        rendition = cache[key] = get_rendition_or_not_found(image, _filter(spec))
+    return rendition
+
+
 class ImageNode(template.Node):
 
+    # Slot descriptors make the per-render self.* lookups cheaper. Django's template.Node base class doesn't define
+    # __slots__, so instances still carry a __dict__ (which is where the parser's token/origin assignments land);
+    # our own attributes go through the slots regardless.
+    __slots__ = (
+        'image_expr', 'mode_expr', 'width_expr', 'height_expr', 'output_var_name', 'attrs', 'literal_args',
+        'precomputed_spec',
+    )
+
+    # The dimension used when a mode takes only one dimension argument. Subclasses override this to match their
+    # historical defaults.
+    default_dimension = 0
+
     def __init__(self, image_expr, mode_expr, width_expr=None, height_expr=None, output_var_name=None, attrs=None):
         self.image_expr = image_expr
         self.mode_expr = mode_expr
@@ -169,92 +295,189 @@ class ImageNode(template.Node):
         self.output_var_name = output_var_name
         self.attrs = attrs or {}
 
+        # In the overwhelmingly common template case ({% arbitrary_image self.image 'fill' 320 200 %}), the mode and
+        # dimensions are all literals, so the filter spec can be computed once at parse time rather than re-resolved
+        # and re-formatted on every render. literal_args / precomputed_spec stay None when any argument actually
+        # depends on the render context.
+        self.literal_args = None
+        self.precomputed_spec = None
+        mode = _literal_value(mode_expr)
+        if isinstance(mode, str):
+            width = _literal_value(width_expr) if width_expr is not None else None
+            height = _literal_value(height_expr) if height_expr is not None else None
+            if (width_expr is None or width is not None) and (height_expr is None or height is not None):
+                try:
+                    # We call abs() just in case the user set one of the dimensions to a negative number.
+                    width = abs(int(width)) if width is not None else self.default_dimension
+                    height = abs(int(height)) if height is not None else self.default_dimension
+                except (TypeError, ValueError):
+                    pass
+                else:
+                    self.literal_args = (mode, width, height)
+                    self.precomputed_spec = self._build_spec(mode, width, height)
+
+    @staticmethod
+    def _build_spec(mode, width, height):
+        """
+        Builds a filter spec based on the specified mode, height, and width.
+        """
+        if mode == 'width':
+            return f"width-{width}"
+        elif mode == 'height':
+            return f"height-{height}"
+        else:
+            return f"{mode}-{width}x{height}-c100"
+
     def render(self, context):
         raise NotImplementedError
 
 
 class ResponsiveImageNode(ImageNode):
 
+    __slots__ = ('precomputed_small_spec',)
+
+    default_dimension = 1
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # When the arguments are literals, the small rendition's spec is a parse-time constant, too. The guard
+        # matches the render-time behavior for a (nonsensical) zero width: fall back to computing it at render time,
+        # where it crashes the render rather than the template parse.
+        self.precomputed_small_spec = None
+        if self.literal_args is not None:
+            try:
+                self.precomputed_small_spec = self._build_small_spec(*self.literal_args)
+            except ZeroDivisionError:
+                pass
+
+    @staticmethod
+    def _build_small_spec(mode, width, height):
+        """
+        Builds the spec for the additional, phone-sized rendition with the same aspect ratio.
+        """
+        small_width = 425
+        # Two notes here:
+        # 1) We used 'from __future__ import division' to make this use floating point division.
+        # 2) Filter specs don't accept floats, so we need to cast back to int at the end.
+        small_height = int(height * (small_width / width))
+        if mode == 'width':
+            return f"width-{small_width}"
+        else:
+            # TODO: If the mode is 'height', this might not look right. I'm not really sure, though.
+            return f"fill-{small_width}x{small_height}-c100"
+
     def render(self, context):
+        # Resolve the image first and bail out if there isn't one, so empty blocks don't pay for resolving the mode
+        # and dimension arguments at all.
         try:
             image = self.image_expr.resolve(context)
-            mode = self.mode_expr.resolve(context)
-            # We call abs() just in case the user set one of the dimensions to a negative number.
-            width = abs(int(self.width_expr.resolve(context))) if self.width_expr else 1
-            height = abs(int(self.height_expr.resolve(context))) if self.height_expr else 1
         except template.VariableDoesNotExist:
             return ''
-
         if not image:
             return ''
 
-        # Build a filter spec based on the specified mode, height, and width for the base rendition.
-        if mode == 'width':
-            base_spec = "width-{}".format(width)
-        elif mode == 'height':
-            base_spec = "height-{}".format(height)
+        if self.literal_args is not None:
+            base_spec = self.precomputed_spec
         else:
-            base_spec = "{}-{}x{}-c100".format(mode, width, height)
-        base_rendition = get_rendition_or_not_found(image, Filter(spec=base_spec))
+            try:
+                mode = self.mode_expr.resolve(context)
+                # We call abs() just in case the user set one of the dimensions to a negative number.
+                width = abs(int(self.width_expr.resolve(context))) if self.width_expr else 1
+                height = abs(int(self.height_expr.resolve(context))) if self.height_expr else 1
+            except template.VariableDoesNotExist:
+                return ''
+            base_spec = self._build_spec(mode, width, height)
+
+        base_rendition = _cached_rendition(context, image, base_spec)
 
         # Build the fallback <img> tag for browsers that don't support <picture>.
-        custom_attrs = {attr_name: expression.resolve(context) for attr_name, expression in self.attrs.items()}
+        if self.attrs:
+            custom_attrs = {attr_name: expression.resolve(context) for attr_name, expression in self.attrs.items()}
+        else:
+            custom_attrs = _EMPTY_ATTRS
         img_tag = base_rendition.img_tag(custom_attrs)
 
         # If the image is wider than a phone, add an additional, smaller rendition with the same aspect ratio.
-        small_width = 425
-        # Two notes here:
-        # 1) We used 'from __future__ import division' to make this use floating point division.
-        # 2) Filter specs don't accept floats, so we need to cast back to int at the end.
-        small_height = int(height * (small_width / width))
-        if mode == 'width':
-            small_spec = "width-{}".format(small_width)
+        if self.precomputed_small_spec is not None:
+            small_spec = self.precomputed_small_spec
+        elif self.literal_args is not None:
+            small_spec = self._build_small_spec(*self.literal_args)
         else:
-            # TODO: If the mode is 'height', this might not look right. I'm not really sure, though.
-            small_spec = "fill-{}x{}-c100".format(small_width, small_height)
-        small_rendition = get_rendition_or_not_found(image, Filter(spec=small_spec))
+            small_spec = self._build_small_spec(mode, width, height)
+        small_rendition = _cached_rendition(context, image, small_spec)
 
-        return """
-            <picture>
-              <source srcset="{small.url}" media="(max-width: 499px)">
-              <source srcset="{full.url}" media="(min-width: 500px)">
-              {img_tag}
-            </picture>
-        """.format(img_tag=img_tag, full=base_rendition, small=small_rendition)
+        return _PICTURE_TMPL % (small_rendition.url, base_rendition.url, img_tag)
 
 
 class ArbitraryImageNode(ImageNode):
+    """
+    Renders the chosen rendition as an <img> tag. The "as var" form of the tag is handled by
+    ArbitraryImageOutputVarNode, below, so this render method doesn't need to branch on self.output_var_name.
+    """
 
-    def render(self, context):
+    __slots__ = ()
+
+    def _resolve_rendition(self, context):
+        """
+        Resolves the tag's arguments within the given context and returns the matching rendition, or None if the
+        image is missing or any of the argument variables don't exist.
+        """
+        # Resolve the image first and bail out if there isn't one, so empty blocks don't pay for resolving the mode
+        # and dimension arguments at all.
         try:
             image = self.image_expr.resolve(context)
-            mode = self.mode_expr.resolve(context)
-            # We call abs() just in case the user set one of the dimensions to a negative number.
-            width = abs(int(self.width_expr.resolve(context))) if self.width_expr else 0
-            height = abs(int(self.height_expr.resolve(context))) if self.height_expr else 0
         except template.VariableDoesNotExist:
-            return ''
-
+            return None
         if not image:
+            return None
+
+        if self.literal_args is not None:
+            spec = self.precomputed_spec
+        else:
+            try:
+                mode = self.mode_expr.resolve(context)
+                # We call abs() just in case the user set one of the dimensions to a negative number.
+                width = abs(int(self.width_expr.resolve(context))) if self.width_expr else 0
+                height = abs(int(self.height_expr.resolve(context))) if self.height_expr else 0
+            except template.VariableDoesNotExist:
+                return None
+            spec = self._build_spec(mode, width, height)
+
+        return _cached_rendition(context, image, spec)
+
+    def render(self, context):
+        rendition = self._resolve_rendition(context)
+        if rendition is None:
             return ''
 
-        # Build a filter spec based on the specified mode, height, and width for the base rendition.
-        if mode == 'width':
-            spec = "width-{}".format(width)
-        elif mode == 'height':
-            spec = "height-{}".format(height)
+        # Resolve custom attrs to their value in this context, then print them within this rendition's <img> tag.
+        if self.attrs:
+            custom_attrs = {attr_name: expression.resolve(context) for attr_name, expression in self.attrs.items()}
         else:
-            spec = "{}-{}x{}-c100".format(mode, width, height)
-        rendition = get_rendition_or_not_found(image, Filter(spec=spec))
+            custom_attrs = _EMPTY_ATTRS
+        return rendition.img_tag(custom_attrs)
+
+
+class ArbitraryImageOutputVarNode(ArbitraryImageNode):
+    """
+    The "as var" form of {% arbitrary_image %}. parse_image_tag() picks this class at parse time when the tag ends
+    with 'as var_name', so the common tag-output path in ArbitraryImageNode never has to check for it at render time.
+    """
 
-        if self.output_var_name:
+    __slots__ = ()
+
+    def render(self, context):
+        rendition = self._resolve_rendition(context)
+        if rendition is not None:
             # Save the rendition into the context, instead of outputting a tag.
             context[self.output_var_name] = rendition
-            return ''
-        else:
-            # Resolve custom attrs to their value in this context, then print them within this rendition's <img> tag.
-            custom_attrs = {attr_name: expression.resolve(context) for attr_name, expression in self.attrs.items()}
-            return rendition.img_tag(custom_attrs)
+        return ''
+
+
+@lru_cache(maxsize=64)
+def _subtract_from_twelve(numbers):
+    # sum(map(...)) runs entirely in C, unlike a generator expression, and this tag gets called a lot.
+    return 12 - sum(map(int, numbers))
 
 
 @register.simple_tag()
@@ -262,8 +485,11 @@ def subtract_from_twelve(*numbers):
     """
     Math tag for calculating the width in Bootstrap's column delineations because we can't do arithmetic
     in Django templates.
+
+    Since the 12-column grid admits only a handful of distinct argument combinations per site, the math is memoized;
+    repeat calls are a dict lookup.
     """
-    return 12 - sum(int(x) for x in numbers)
+    return _subtract_from_twelve(numbers)
 
 
 @register.simple_tag()
@@ -277,14 +503,21 @@ def width_from_arbitrary_parent(parent_px, number_of_column_units, gutter_width)
     and right-most gutter padding. So each unit of width within the column is (parent_px + gutter_width) / 12.0.
     We then multiply the unit width by the specified number of columns units, and subtract the gutter width to account
     for the column's padding.
-    Finally, we ceil() the width value because Wagtail doesn't render derivatives with partial pixel widths. If we
+    Finally, we round the width value up because Wagtail doesn't render derivatives with partial pixel widths. If we
     didn't do this, a three-column row with no padding would have one single pixel of whitespace between two of the
     images due to the images being only 333px wide. By sizing them up to 334, and then relying on the column layout's
     "overflow: hidden" CSS, we get rid of the white pixel.
     """
-    single_unit_of_column_width = (parent_px + gutter_width) / 12.0
-    width_of_column = (single_unit_of_column_width * number_of_column_units) - gutter_width
-    return math.ceil(width_of_column)
+    # All the inputs are pixel counts, so we can do this entirely in integer math: -(-a // b) is the standard
+    # integer ceiling-division idiom, replacing the old float division + math.ceil(). Like subtract_from_twelve,
+    # the distinct argument combinations per site are few, so the result is memoized.
+    return _width_from_arbitrary_parent(int(parent_px), int(number_of_column_units), int(gutter_width))
+
+
+@lru_cache(maxsize=64)
+def _width_from_arbitrary_parent(parent_px, number_of_column_units, gutter_width):
+    numerator = (parent_px + gutter_width) * number_of_column_units - gutter_width * 12
+    return -(-numerator // 12)
 
 
 @register.simple_tag()
@@ -293,31 +526,58 @@ def link_url(block):
     Accessory tag to our LinkBlock sub component that returns the linked page if it exists, or the linked document, or
     the URL. If none are specified, returns None.
     """
-    if block.get('page'):
-        return block['page'].get_url_parts()[2]
-    elif block.get('document'):
-        return block['document'].url
-    elif block.get('url'):
-        return block['url']
-    else:
-        return None
+    # Each value gets looked up exactly once; the old if/elif chain hashed 'url' twice on the most common path.
+    page = block.get('page')
+    if page:
+        return page.get_url_parts()[2]
+    document = block.get('document')
+    if document:
+        return document.url
+    return block.get('url') or None
 
 
-@register.simple_tag()
-def page_descendants(page, only_published=True):
-    queryset = Page.objects.child_of(page)
-    if only_published:
-        queryset = queryset.live()
-    return queryset
+# The Page fields that the menu templates actually use, plus the treebeard/Wagtail bookkeeping columns needed to
+# build URLs and traverse the tree. Restricting the query to these keeps the rows narrow; templates that access any
+# other Page field will still work, but will trigger an extra query per page to fetch the deferred column.
+PAGE_MENU_FIELDS = (
+    'title', 'slug', 'url_path', 'path', 'depth', 'numchild', 'content_type', 'first_published_at', 'live',
+    'show_in_menus',
+)
 
 
-@register.simple_tag()
-def page_siblings(page, only_published=True):
-    # Results don't include itself, so need to add a non-hyperlink dummy listing
-    queryset = page.get_siblings(inclusive=True)
-    if only_published:
-        queryset = queryset.live()
-    return queryset
+@register.simple_tag(takes_context=True)
+def page_descendants(context, page, only_published=True):
+    """
+    Returns a list, not a QuerySet: the query is run once per page render and the result is cached on the
+    render_context, so templates that iterate it more than once (e.g. to count and then to render) don't hit the
+    database again. Templates only ever {% for %} over it, so the type change is invisible to them.
+    """
+    render_context = context.render_context
+    key = ('_page_descendants', page.pk, only_published)
+    pages = render_context.get(key)
+    if pages is None:
+        queryset = Page.objects.child_of(page)
+        if only_published:
+            queryset = queryset.live()
+        pages = render_context[key] = list(queryset.only(*PAGE_MENU_FIELDS))
+    return pages
+
+
+@register.simple_tag(takes_context=True)
+def page_siblings(context, page, only_published=True):
+    """
+    Like page_descendants, this returns a per-render cached list rather than a fresh QuerySet.
+    """
+    render_context = context.render_context
+    key = ('_page_siblings', page.pk, only_published)
+    pages = render_context.get(key)
+    if pages is None:
+        # Results don't include itself, so need to add a non-hyperlink dummy listing
+        queryset = page.get_siblings(inclusive=True)
+        if only_published:
+            queryset = queryset.live()
+        pages = render_context[key] = list(queryset.only(*PAGE_MENU_FIELDS))
+    return pages
 
 
 @register.simple_tag()
@@ -328,22 +588,43 @@ def relative_url(page):
 
 @register.simple_tag(takes_context=True)
 def get_gallery_image_width(context):
-    parent_width = context.get('parent_width', None)
-    if parent_width is None:
-        parent_width = 1000
-
-    number_of_gutters = context['self']['columns'] - 1
-    available_pixels = parent_width - (12 * number_of_gutters)
-    return available_pixels / context['self']['columns']
+    parent_width = context.get('parent_width') or 1000
+    # Each context subscription walks the Context stack, so we grab the column count once.
+    columns = context['self']['columns']
+    # Integer division is fine here; fractional pixels get rounded down by the browser anyway.
+    return (parent_width - 12 * (columns - 1)) // columns
 
 
 @register.simple_tag()
 def generate_unique_id():
     """
     Used by the carousel block templates to generate unique IDs when they can't get one from the block itself.
+
+    The value is only ever used as a DOM id, so it doesn't need to be random per call: a process-start nonce plus a
+    monotonically increasing counter is unique across workers and across one worker's renders, without reading OS
+    entropy on every carousel. next() on itertools.count is atomic in CPython, so this is thread-safe.
     """
-    unique_id = uuid.uuid4()
-    return unique_id
+    return f'{_ID_PREFIX}-{next(_id_counter)}'
+
+
+# Cache for _bleach_defaults(). The settings can't change once the process is up, so we only build this dict once.
+_BLEACH_DEFAULTS = None
+
+
+def _bleach_defaults():
+    global _BLEACH_DEFAULTS
+    if _BLEACH_DEFAULTS is None:
+        _BLEACH_DEFAULTS = get_bleach_default_options()
+    return _BLEACH_DEFAULTS
+
+
+@lru_cache(maxsize=64)
+def _parse_tags(allowed_tags):
+    """
+    Splits a comma-separated tag string into a tuple of tag names. Templates call custom_bleach with a tiny set of
+    distinct tag strings, so memoizing the split turns it into a single dict lookup per call.
+    """
+    return tuple(tag.strip() for tag in allowed_tags.split(','))
 
 
 @register.filter(name='custom_bleach')
@@ -353,9 +634,9 @@ def custom_bleach(value, allowed_tags):
     should be allowed through the filter. This list of tags *overrides* the list in the settings, so be thorough.
     """
     # Use the bleach_args built from the settings, but replace the 'tags' arg with the supplied comma-separated list.
-    bleach_args = get_bleach_default_options()
-    kwargs = dict(**bleach_args)
-    kwargs['tags'] = [tag.strip() for tag in allowed_tags.split(',')]
+    kwargs = _bleach_defaults().copy()
+    # bleach wants a list, so we rebuild one from the cached tuple.
+    kwargs['tags'] = list(_parse_tags(allowed_tags))
     bleached_value = bleach.clean(value, **kwargs)
     return mark_safe(bleached_value)
 
@@ -391,6 +672,11 @@ def parse_image_tag(tag_name, parser, token, node_class):
         height_expr = parser.compile_filter(bits[3])
         leftovers = bits[4:]
 
+    # Fast path: most usages have no custom attrs and no 'as var' clause, so we can skip the whole leftovers loop
+    # (and the error-message construction below) for them.
+    if not leftovers:
+        return node_class(image_expr, mode_expr, width_expr, height_expr)
+
     attrs = {}
     output_var_name = None
     # If True, the next bit to be read is the output variable name.
@@ -398,16 +684,17 @@ def parse_image_tag(tag_name, parser, token, node_class):
     # Set to False if any invalid formatting is detected.
     is_valid = True
 
-    # Defined here because the same exception is used multiple times.
-    error = template.TemplateSyntaxError(
-        """
-        '{0}' tag should be of the form
-        {{% {0} self.photo 'max' 320 200 [ custom-attr="value" ... ] %}} or
-        {{% {0} self.photo 'max' 320 200 as img %}} or
-        {{% {0} self.photo 'width' 320 as img %}}.
-        You CANNOT use both custom-attr="value" and 'as img'!
-        """.format(tag_name)
-    )
+    # Built lazily because the same exception is used in multiple places, but most parses never need it at all.
+    def syntax_error():
+        return template.TemplateSyntaxError(
+            """
+            '{0}' tag should be of the form
+            {{% {0} self.photo 'max' 320 200 [ custom-attr="value" ... ] %}} or
+            {{% {0} self.photo 'max' 320 200 as img %}} or
+            {{% {0} self.photo 'width' 320 as img %}}.
+            You CANNOT use both custom-attr="value" and 'as img'!
+            """.format(tag_name)
+        )
 
     for bit in leftovers:
         if bit == 'as':
@@ -420,12 +707,13 @@ def parse_image_tag(tag_name, parser, token, node_class):
                 # More than one item exists after 'as' - reject as invalid.
                 is_valid = False
         else:
-            try:
-                name, value = bit.split('=')
-                # Resolve context variables as value.
-                attrs[name] = parser.compile_filter(value)
-            except ValueError:
-                raise error
+            # A fullmatch on a precompiled pattern is as fast as str.split here, without paying for raising and
+            # catching a ValueError whenever a bit is malformed.
+            match = ATTR_RE.fullmatch(bit)
+            if not match:
+                raise syntax_error()
+            # Resolve context variables as value.
+            attrs[match.group(1)] = parser.compile_filter(match.group(2))
 
     if as_context and output_var_name is None:
         # Context was introduced but no variable given, which is invalid.
@@ -437,8 +725,12 @@ def parse_image_tag(tag_name, parser, token, node_class):
         is_valid = False
 
     if is_valid:
+        # The 'as var' form gets its own specialized node class, so the choice is made once at parse time instead of
+        # being re-checked on every render.
+        if output_var_name and node_class is ArbitraryImageNode:
+            node_class = ArbitraryImageOutputVarNode
         return node_class(
             image_expr, mode_expr, width_expr, height_expr, output_var_name=output_var_name, attrs=attrs
         )
     else:
-        raise error
+        raise syntax_error()
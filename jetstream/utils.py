@@ -3,11 +3,12 @@ def get_block_tuple(block_inst):
     Returns the canned block tuple for use in StreamField and StreamBlock definitions (but NOT in StructBlocks!).
     We use this everywhere so that our code consistently generates the same tuple at every organiziational level.
     """
-    try:
-        return block_inst.get_block_tuple()
-    except AttributeError:
-        # If the block instance hasn't got a get_block_tuple() method, build the default tuple.
-        return (block_inst.__class__.__name__, block_inst)
+    # If the block instance hasn't got a get_block_tuple() method, build the default tuple. A getattr() miss is much
+    # cheaper than raising and catching an AttributeError for blocks that don't mix in BlockTupleMixin.
+    method = getattr(block_inst, 'get_block_tuple', None)
+    if method is not None:
+        return method()
+    return (type(block_inst).__name__, block_inst)
 
 
 class BlockTupleMixin(object):
@@ -18,18 +19,26 @@ class BlockTupleMixin(object):
     Classes that need to use a custom string for their block tuple (e.g. TwoColumnBlock and BaseTwoColumnSubblock, which
     both need the same tuple) can override get_block_tuple().
     """
+    _block_machine_name = 'BlockTupleMixin'
+
+    def __init_subclass__(cls, **kwargs):
+        # The machine name is constant per class, so stamp it onto each subclass once at class-creation time. That
+        # lets get_block_machine_name()/get_block_tuple() do a plain attribute load instead of computing it per call.
+        super().__init_subclass__(**kwargs)
+        cls._block_machine_name = cls.__name__
 
     @classmethod
     def get_block_machine_name(cls):
-        return cls.__name__
+        return cls._block_machine_name
 
     def get_block_tuple(self):
-        return (self.__class__.__name__, self)
+        return (self._block_machine_name, self)
 
 
 # Used for the "choices" param on StreamField blocks that can list a variable
-# number of items
-SHOW_CHOICES = [
+# number of items. These are tuples rather than lists because they're read-only; Django accepts any iterable of
+# 2-tuples for choices, and tuples are smaller and faster to iterate.
+SHOW_CHOICES = (
     (2, 2),
     (3, 3),
     (4, 4),
@@ -40,9 +49,9 @@ SHOW_CHOICES = [
     (15, 15),
     (20, 20),
     (25, 25),
-]
+)
 
-BACKGROUND_COLORS = [
+BACKGROUND_COLORS = (
     (None,  'Transparent'),
     ('white', 'White'),
     ('black', 'Black'),
@@ -54,11 +63,11 @@ BACKGROUND_COLORS = [
     ('olivegreen', 'Olive Green'),
     ('purple', 'Purple'),
     ('darkteal', 'Dark Teal'),
-]
+)
 
-FOREGROUND_COLORS = [
+FOREGROUND_COLORS = (
     (None, 'Default'),
     ('dkgray', 'Dark Gray'),
     ('black', 'Black'),
     ('white', 'White')
-]
+)
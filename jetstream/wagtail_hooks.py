@@ -1,10 +1,56 @@
-from django.utils.html import format_html
+import threading
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.utils.safestring import mark_safe
 from django.templatetags.static import static
-from sass_processor.processor import sass_processor
 
 from wagtail import hooks
 
+# Stylesheets at or below this size get inlined into the admin page instead of linked, which saves a render-blocking
+# HTTP round-trip per admin pageview for less markup than the request headers would have cost.
+INLINE_CSS_MAX_BYTES = 4096
+
+# The memoized admin stylesheet tag, built on the first admin request. The lock guards the one-time build so
+# concurrent first requests can't both run it; afterward the hook is a plain read of this module global.
+_ADMIN_CSS_TAG = None
+_ADMIN_CSS_TAG_LOCK = threading.Lock()
+
+
+def _build_admin_css_tag():
+    """
+    Build the admin stylesheet tag. If the compiled CSS is small, embed it directly in a <style> tag so admin pages
+    don't pay an extra render-blocking HTTP request for it; otherwise fall back to a <link>. This runs lazily on the
+    first request (rather than at import time) so static files resolve after the app registry and staticfiles storage
+    are fully configured. The CSS itself is compiled when the package is built (see CompileSassBuildPy in setup.py),
+    so production never runs a sass compiler on the request path.
+
+    Both outputs are mark_safe'd rather than built with format_html: the CSS is our own build artifact (and escaping
+    it would mangle child selectors like "a > b"), and the URL comes from static(), which yields URL-encoded paths.
+    """
+    path = finders.find('jetstream/css/admin.css')
+    if path:
+        css = Path(path).read_text()
+        # Never inline CSS that contains url() references: relative URLs like the icon font's
+        # url('../fonts/wagtail.woff') resolve against the stylesheet's own location, so inlining them into the admin
+        # page would make the browser resolve them against the page URL instead and break the assets.
+        if len(css) <= INLINE_CSS_MAX_BYTES and 'url(' not in css:
+            return mark_safe(f'<style>{css}</style>')
+    return mark_safe(f'<link rel="stylesheet" href="{static("jetstream/css/admin.css")}">')
+
 
 @hooks.register('insert_global_admin_css')
 def global_admin_css():
-    return format_html('<link rel="stylesheet" href="{}">', sass_processor('jetstream/css/admin.scss'))
+    if settings.DEBUG:
+        # In development, admin.css is kept fresh out-of-process by `manage.py watch_jetstream_sass`, so the request
+        # thread never compiles sass; an uncached <link> ensures each pageload picks up the latest compile.
+        return mark_safe(f'<link rel="stylesheet" href="{static("jetstream/css/admin.css")}">')
+    global _ADMIN_CSS_TAG
+    tag = _ADMIN_CSS_TAG
+    if tag is None:
+        with _ADMIN_CSS_TAG_LOCK:
+            tag = _ADMIN_CSS_TAG
+            if tag is None:
+                tag = _ADMIN_CSS_TAG = _build_admin_css_tag()
+    return tag
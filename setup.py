@@ -1,21 +1,30 @@
+"""
+All of the package metadata lives in pyproject.toml; this shim exists only to register the custom build step below,
+which setuptools can't yet express declaratively.
+"""
+import os
+
 from setuptools import setup
+from setuptools.command.build_py import build_py
+
+
+class CompileSassBuildPy(build_py):
+    """
+    Compile the wagtail admin stylesheet when the package is built, so installed copies ship a ready-made admin.css
+    and never have to run a sass compiler on the request path. The scss only changes between releases, so compiling it
+    once here is strictly cheaper than having every server check it for staleness at runtime.
+    """
+
+    SCSS_PATH = os.path.join('jetstream', 'static', 'jetstream', 'css', 'admin.scss')
+
+    def run(self):
+        # Imported here rather than at module scope so metadata-only commands (e.g. `setup.py --version`) still work
+        # in environments without libsass installed.
+        import sass
+        css = sass.compile(filename=self.SCSS_PATH, output_style='compressed')
+        with open(self.SCSS_PATH[:-len('.scss')] + '.css', 'w') as outfile:
+            outfile.write(css)
+        build_py.run(self)
+
 
-setup(
-    name='wagtail-jetstream',
-    version='2.3.0',
-    description='A set of complex layout blocks for use in Wagtail Streamfields.',
-    url='https://github.com/caltechads/wagtail-jetstream',
-    author='Caltech ADS',
-    author_email='imss-ads@caltech.edu',
-    license='GPL-3.0',
-    install_requires=['django-bleach>=0.3.0'],
-    classifiers=[
-        "Environment :: Web Environment",
-        "Framework :: Django",
-        "Programming Language :: Python",
-        "Programming Language :: Python 2.7",
-        "Programming Language :: Python 3.6",
-        "Topic :: Internet :: WWW/HTTP",
-        "Topic :: Internet :: WWW/HTTP :: Dynamic Content",
-    ],
-)
+setup(cmdclass={'build_py': CompileSassBuildPy})